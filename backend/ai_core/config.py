@@ -1,14 +1,17 @@
 """
 Configuration objects and constants for the sarcasm detection system.
 
-This module defines dataclasses to centralize tunable parameters for data
-splits, vectorizers, model training, and artifact paths. It also contains
-shared label/name constants used across training and evaluation.
+This module defines frozen dataclasses to centralize tunable parameters for
+data splits, vectorizers, model training and its budgets, request batching,
+and artifact paths. PipelineConfig maps each model name to a TrainerSpec that
+picks a trainer from ai_core.models.registry. It also contains shared
+label/name constants used across training and evaluation.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
-@dataclass
+@dataclass(frozen=True)
 class ModelConfig:
     test_size: float = 0.2
     random_state: int = 42
@@ -16,13 +19,71 @@ class ModelConfig:
     ngram_range: tuple = (1, 3)
     min_df: int = 2
     max_df: float = 0.8
+    pruning_error_rate: float = 2e-4
+    feature_selection: Optional[str] = "chi2"
+    selected_features: int = 3000
+    report_selection_effect: bool = False
+    featurizer: str = "vocabulary"
+    hashing_features: int = 2**18
+    max_training_seconds: Optional[float] = 300.0
+    max_memory_mb: Optional[float] = 2048.0
+    max_rows: Optional[int] = 200_000
+    budget_subsample_fraction: float = 0.5
+    max_training_attempts: int = 3
 
-@dataclass
+@dataclass(frozen=True)
 class LogisticRegressionConfig(ModelConfig):
+    solver: str = "lbfgs"
+    tol: float = 1e-4
     max_iter: int = 1000
     class_weight: str = "balanced"
 
-@dataclass
+@dataclass(frozen=True)
+class SGDConfig(ModelConfig):
+    loss: str = "log_loss"
+    alpha: float = 1e-5
+    tol: float = 1e-3
+    max_iter: int = 50
+    early_stopping: bool = True
+    validation_fraction: float = 0.1
+    n_iter_no_change: int = 5
+    class_weight: str = "balanced"
+
+@dataclass(frozen=True)
+class LinearSVCConfig(ModelConfig):
+    C: float = 1.0
+    tol: float = 1e-4
+    max_iter: int = 1000
+    class_weight: str = "balanced"
+    calibration_method: str = "sigmoid"
+    calibration_cv: int = 3
+
+@dataclass(frozen=True)
+class ComplementNBConfig(ModelConfig):
+    alpha: float = 1.0
+    norm: bool = False
+
+@dataclass(frozen=True)
+class TrainerSpec:
+    trainer: str
+    config: ModelConfig = field(default_factory=ModelConfig)
+
+@dataclass(frozen=True)
+class BatchingConfig:
+    max_batch_size: int = 64
+    max_wait_ms: float = 3.0
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    track_memory: bool = False
+    isolate_training: bool = True
+    batching: BatchingConfig = field(default_factory=BatchingConfig)
+    trainers: Dict[str, TrainerSpec] = field(default_factory=lambda: {
+        "logistic_regression": TrainerSpec("logistic_regression", LogisticRegressionConfig()),
+        "naive_bayes": TrainerSpec("naive_bayes", ModelConfig()),
+    })
+
+@dataclass(frozen=True)
 class PathConfig:
     confusion_matrix_path: str = "confusion_matrix"
     model_save_path: str = "results/"
@@ -1,14 +1,19 @@
 """
 Data structures used throughout the pipeline.
 - TrainingData: clean texts and labels prepared for modeling
+- CalibrationBin: one reliability bin of predicted vs observed positive rate
+- EvaluationMetrics: confusion matrix, scores and calibration computed once per evaluation
 - ModelResult: trained estimator, vectorizer, test split and metrics holder
 - PredictionResult: single-sample prediction output with label and confidence
+- ModelSnapshot: immutable, versioned set of trained models for serving
+- BudgetOutcome: how a model's training went against its time/memory/row budgets
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Any
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Any, Mapping, Optional
 import pandas as pd
 from sklearn.base import BaseEstimator
+from sklearn.model_selection import train_test_split
 
 @dataclass
 class TrainingData:
@@ -17,8 +22,49 @@ class TrainingData:
     
     def get_class_distribution(self) -> Dict[int, int]:
         return pd.Series(self.labels).value_counts().to_dict()
+    
+    def subsample(self, rows: int, random_state: int) -> "TrainingData":
+        if rows >= len(self.headlines):
+            return self
+        headlines, _, labels, _ = train_test_split(
+            self.headlines,
+            self.labels,
+            train_size=rows,
+            random_state=random_state,
+            stratify=self.labels
+        )
+        return TrainingData(headlines=list(headlines), labels=list(labels))
 
-@dataclass
+@dataclass(frozen=True)
+class CalibrationBin:
+    lower: float
+    upper: float
+    count: int
+    mean_predicted: float
+    fraction_positive: float
+
+@dataclass(frozen=True)
+class EvaluationMetrics:
+    accuracy: float
+    precision: float
+    recall: float
+    f1_score: float
+    roc_auc: float
+    confusion_matrix: List[List[int]]
+    calibration: List[CalibrationBin]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "accuracy": self.accuracy,
+            "precision": self.precision,
+            "recall": self.recall,
+            "f1_score": self.f1_score,
+            "roc_auc": self.roc_auc,
+            "confusion_matrix": self.confusion_matrix,
+            "calibration": [asdict(calibration_bin) for calibration_bin in self.calibration]
+        }
+
+@dataclass(frozen=True)
 class ModelResult:
     model: BaseEstimator
     vectorizer: Any
@@ -27,13 +73,28 @@ class ModelResult:
     predictions: List[int]
     accuracy: float
     model_name: str
+    metrics: Optional[EvaluationMetrics] = None
+    training_time: float = 0.0
+    n_features: int = 0
+    n_candidate_features: int = 0
+    accuracy_without_selection: Optional[float] = None
+    selection_check_time: float = 0.0
+    peak_memory_mb: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data = {
             "model_name": self.model_name,
             "accuracy": self.accuracy,
-            "test_set_size": len(self.y_test)
+            "test_set_size": len(self.y_test),
+            "training_time": self.training_time,
+            "n_features": self.n_features,
+            "n_candidate_features": self.n_candidate_features,
+            "accuracy_without_selection": self.accuracy_without_selection,
+            "peak_memory_mb": self.peak_memory_mb
         }
+        if self.metrics is not None:
+            data.update(self.metrics.to_dict())
+        return data
 
 @dataclass
 class PredictionResult:
@@ -45,3 +106,24 @@ class PredictionResult:
     @property
     def prediction_label(self) -> str:
         return "Sarcastic" if self.is_sarcastic else "Not Sarcastic"
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    version: int
+    model_results: Mapping[str, ModelResult]
+    preprocessing_version: str
+    created_at: float
+    
+    @property
+    def metrics(self) -> Dict[str, Optional[EvaluationMetrics]]:
+        return {name: result.metrics for name, result in self.model_results.items()}
+
+@dataclass(frozen=True)
+class BudgetOutcome:
+    completed: bool
+    fallbacks: List[str]
+    rows_used: int
+    attempts: int
+    peak_rss_mb: Optional[float]
+    events: List[str]
@@ -1,16 +1,39 @@
 """
 Abstract base class for model trainers.
+
+Besides the stratified split it offers the shared vectorize/fit/predict flow,
+so concrete trainers only choose a vectorizer and build an estimator. The
+vectorizer's vocabulary is built from pruned n-gram counts and narrowed by
+supervised feature selection before the model is fitted (optionally refitting
+on the unselected vocabulary to report the accuracy effect), or replaced by a
+hashing featurizer when the config asks for it (e.g. as a memory fallback).
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+import time
+from typing import List, Optional, Tuple, Type
+from sklearn.base import BaseEstimator, clone
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.metrics import accuracy_score
 from sklearn.model_selection import train_test_split
+from sklearn.pipeline import make_pipeline
 
 from ai_core.data.models import ModelResult, TrainingData
 from ai_core.config import ModelConfig
+from ai_core.utils.feature_selection import candidate_vocabulary, count_document_frequencies, select_features
+
+FEATURIZERS = ("vocabulary", "hashing")
 
 class BaseModelTrainer(ABC):
+    config_class: Type[ModelConfig] = ModelConfig
+
     def __init__(self, config: ModelConfig):
+        if config.featurizer not in FEATURIZERS:
+            raise ValueError(f"Unknown featurizer '{config.featurizer}', expected one of {FEATURIZERS}")
+        if config.max_training_attempts < 1:
+            raise ValueError(f"max_training_attempts must be at least 1, got {config.max_training_attempts}")
+        if not 0 < config.budget_subsample_fraction < 1:
+            raise ValueError(f"budget_subsample_fraction must be between 0 and 1, got {config.budget_subsample_fraction}")
         self.config = config
     
     @abstractmethod
@@ -25,3 +48,98 @@ class BaseModelTrainer(ABC):
             random_state=self.config.random_state,
             stratify=labels
         )
+    
+    def _create_vectorizer(self, vectorizer_class, vocabulary: Optional[List[str]] = None):
+        return vectorizer_class(
+            max_features=self.config.max_features,
+            ngram_range=self.config.ngram_range,
+            stop_words="english",
+            min_df=self.config.min_df,
+            max_df=self.config.max_df,
+            vocabulary=vocabulary,
+        )
+    
+    def _create_hashing_vectorizer(self, vectorizer_class):
+        # Stateless, so memory stays flat no matter how many distinct n-grams the data has
+        hashing = HashingVectorizer(
+            n_features=self.config.hashing_features,
+            ngram_range=self.config.ngram_range,
+            stop_words="english",
+            alternate_sign=False,
+            norm=None,
+        )
+        if issubclass(vectorizer_class, TfidfVectorizer):
+            return make_pipeline(hashing, TfidfTransformer())
+        return hashing
+    
+    def _build_vocabulary(self, vectorizer_class, X_train: List[str], y_train: List[int]) -> Tuple[List[str], List[str]]:
+        analyzer = self._create_vectorizer(vectorizer_class).build_analyzer()
+        
+        doc_frequencies = count_document_frequencies(X_train, analyzer, self.config.pruning_error_rate)
+        candidates = candidate_vocabulary(
+            doc_frequencies,
+            len(X_train),
+            self.config.min_df,
+            self.config.max_df,
+            self.config.max_features,
+        )
+        selected = select_features(
+            X_train,
+            y_train,
+            candidates,
+            analyzer,
+            self.config.feature_selection,
+            self.config.selected_features,
+            self.config.random_state,
+        )
+        
+        print(f"Vocabulary: {len(doc_frequencies):,} n-grams kept after pruning, "
+              f"{len(candidates):,} candidates, {len(selected):,} selected ({self.config.feature_selection or 'no selection'})")
+        return candidates, selected
+    
+    def _accuracy_without_selection(self, vectorizer_class, model: BaseEstimator, candidates: List[str], X_train, X_test, y_train, y_test) -> float:
+        """Fit the same estimator on the unselected candidate vocabulary to measure what selection costs or gains."""
+        vectorizer = self._create_vectorizer(vectorizer_class, candidates)
+        baseline = clone(model).fit(vectorizer.fit_transform(X_train), y_train)
+        return float(accuracy_score(y_test, baseline.predict(vectorizer.transform(X_test))))
+    
+    def _fit_and_evaluate(self, data: TrainingData, vectorizer_class, model: BaseEstimator, model_name: str) -> ModelResult:
+        X_train, X_test, y_train, y_test = self._split_data(data.headlines, data.labels)
+        
+        candidates = None
+        if self.config.featurizer == "hashing":
+            vectorizer = self._create_hashing_vectorizer(vectorizer_class)
+            n_features = self.config.hashing_features
+        else:
+            candidates, vocabulary = self._build_vocabulary(vectorizer_class, X_train, y_train)
+            vectorizer = self._create_vectorizer(vectorizer_class, vocabulary)
+            n_features = len(vocabulary)
+        
+        X_train_vec = vectorizer.fit_transform(X_train)
+        X_test_vec = vectorizer.transform(X_test)
+        
+        model.fit(X_train_vec, y_train)
+        predictions = model.predict(X_test_vec)
+        
+        accuracy_without_selection = None
+        selection_check_time = 0.0
+        if self.config.report_selection_effect and candidates is not None and len(candidates) > n_features:
+            start = time.perf_counter()
+            accuracy_without_selection = self._accuracy_without_selection(
+                vectorizer_class, model, candidates, X_train, X_test, y_train, y_test
+            )
+            selection_check_time = time.perf_counter() - start
+        
+        return ModelResult(
+            model=model,
+            vectorizer=vectorizer,
+            X_test=X_test_vec,
+            y_test=y_test,
+            predictions=predictions,
+            accuracy=0.0,
+            model_name=model_name,
+            n_features=n_features,
+            n_candidate_features=len(candidates) if candidates is not None else n_features,
+            accuracy_without_selection=accuracy_without_selection,
+            selection_check_time=selection_check_time
+        )
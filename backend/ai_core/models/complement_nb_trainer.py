@@ -0,0 +1,26 @@
+"""
+Complement Naive Bayes trainer using TF-IDF features.
+
+ComplementNB estimates each class from the complement of its samples, which
+makes it more stable than MultinomialNB on text while keeping the same
+near-instant training cost.
+"""
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.naive_bayes import ComplementNB
+
+from ai_core.data.models import ModelResult, TrainingData
+from ai_core.models.base_model_trainer import BaseModelTrainer
+from ai_core.config import ComplementNBConfig
+
+class ComplementNBTrainer(BaseModelTrainer):
+    config_class = ComplementNBConfig
+
+    def __init__(self, config: ComplementNBConfig):
+        super().__init__(config)
+        self.cnb_config = config
+    
+    def train(self, data: TrainingData) -> ModelResult:
+        model = ComplementNB(alpha=self.cnb_config.alpha, norm=self.cnb_config.norm)
+        
+        return self._fit_and_evaluate(data, TfidfVectorizer, model, "Complement Naive Bayes")
@@ -0,0 +1,37 @@
+"""
+Linear Support Vector Classifier trainer using TF-IDF features.
+
+LinearSVC has no predict_proba, so it is wrapped in CalibratedClassifierCV to
+provide calibrated probabilities for confidence scores.
+"""
+
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.svm import LinearSVC
+
+from ai_core.data.models import ModelResult, TrainingData
+from ai_core.models.base_model_trainer import BaseModelTrainer
+from ai_core.config import LinearSVCConfig
+
+class LinearSVCTrainer(BaseModelTrainer):
+    config_class = LinearSVCConfig
+
+    def __init__(self, config: LinearSVCConfig):
+        super().__init__(config)
+        self.svc_config = config
+    
+    def train(self, data: TrainingData) -> ModelResult:
+        svc = LinearSVC(
+            C=self.svc_config.C,
+            tol=self.svc_config.tol,
+            max_iter=self.svc_config.max_iter,
+            class_weight=self.svc_config.class_weight,
+            random_state=self.config.random_state,
+        )
+        model = CalibratedClassifierCV(
+            svc,
+            method=self.svc_config.calibration_method,
+            cv=self.svc_config.calibration_cv,
+        )
+        
+        return self._fit_and_evaluate(data, TfidfVectorizer, model, "Linear SVC")
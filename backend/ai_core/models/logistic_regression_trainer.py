@@ -3,7 +3,8 @@ Logistic Regression trainer using TF-IDF features.
 
 Vectorizes text with TfidfVectorizer and fits a LogisticRegression model
 with configurable solver parameters, returning a ModelResult for evaluation
-and predictions.
+and predictions. The solver stops early once the loss improves by less than
+`tol`, or after `max_iter` iterations.
 """
 
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -13,40 +14,24 @@ from ai_core.data.models import ModelResult, TrainingData
 from ai_core.models.base_model_trainer import BaseModelTrainer
 from ai_core.config import LogisticRegressionConfig
 
+SUPPORTED_SOLVERS = ("lbfgs", "liblinear", "saga")
+
 class LogisticRegressionTrainer(BaseModelTrainer):
+    config_class = LogisticRegressionConfig
+
     def __init__(self, config: LogisticRegressionConfig):
         super().__init__(config)
+        if config.solver not in SUPPORTED_SOLVERS:
+            raise ValueError(f"Unsupported solver '{config.solver}', expected one of {SUPPORTED_SOLVERS}")
         self.lr_config = config
     
     def train(self, data: TrainingData) -> ModelResult:
-        X_train, X_test, y_train, y_test = self._split_data(data.headlines, data.labels)
-        
-        vectorizer = TfidfVectorizer(
-            max_features=self.config.max_features,
-            ngram_range=self.config.ngram_range,
-            stop_words="english",
-            min_df=self.config.min_df,
-            max_df=self.config.max_df,
-        )
-        
-        X_train_vec = vectorizer.fit_transform(X_train)
-        X_test_vec = vectorizer.transform(X_test)
-        
         model = LogisticRegression(
             random_state=self.config.random_state,
+            solver=self.lr_config.solver,
+            tol=self.lr_config.tol,
             max_iter=self.lr_config.max_iter,
             class_weight=self.lr_config.class_weight,
         )
         
-        model.fit(X_train_vec, y_train)
-        predictions = model.predict(X_test_vec)
-        
-        return ModelResult(
-            model=model,
-            vectorizer=vectorizer,
-            X_test=X_test_vec,
-            y_test=y_test,
-            predictions=predictions,
-            accuracy=0.0,
-            model_name="Logistic Regression"
-        )
+        return self._fit_and_evaluate(data, TfidfVectorizer, model, "Logistic Regression")
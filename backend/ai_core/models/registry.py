@@ -0,0 +1,92 @@
+"""
+Registry of available model trainers keyed by name.
+
+The pipeline builds its trainers from TrainerSpec entries by looking up the
+trainer name here. `load_pipeline_config` reads a JSON config file (by default
+`pipeline_config.json`, or the path in the PIPELINE_CONFIG_PATH environment
+variable), so models can be added, removed or tuned without code changes:
+
+    {
+        "trainers": {
+            "logistic_regression": {"trainer": "logistic_regression", "params": {"solver": "saga"}},
+            "sgd": {"trainer": "sgd", "params": {"alpha": 1e-4}}
+        },
+        "batching": {"max_batch_size": 32, "max_wait_ms": 2}
+    }
+"""
+
+from dataclasses import fields
+import json
+import os
+from typing import Any, Dict, Optional, Type
+
+from ai_core.config import BatchingConfig, PipelineConfig, TrainerSpec
+from ai_core.models.base_model_trainer import BaseModelTrainer
+from ai_core.models.bayes_naive_trainer import NaiveBayesTrainer
+from ai_core.models.complement_nb_trainer import ComplementNBTrainer
+from ai_core.models.linear_svc_trainer import LinearSVCTrainer
+from ai_core.models.logistic_regression_trainer import LogisticRegressionTrainer
+from ai_core.models.sgd_trainer import SGDTrainer
+
+DEFAULT_CONFIG_PATH = "pipeline_config.json"
+
+TRAINER_REGISTRY: Dict[str, Type[BaseModelTrainer]] = {
+    "logistic_regression": LogisticRegressionTrainer,
+    "naive_bayes": NaiveBayesTrainer,
+    "sgd": SGDTrainer,
+    "linear_svc": LinearSVCTrainer,
+    "complement_nb": ComplementNBTrainer,
+}
+
+def get_trainer_class(name: str) -> Type[BaseModelTrainer]:
+    if name not in TRAINER_REGISTRY:
+        raise ValueError(f"Unknown trainer '{name}', available trainers: {sorted(TRAINER_REGISTRY)}")
+    return TRAINER_REGISTRY[name]
+
+def create_trainer(spec: TrainerSpec) -> BaseModelTrainer:
+    trainer_class = get_trainer_class(spec.trainer)
+    if not isinstance(spec.config, trainer_class.config_class):
+        raise TypeError(
+            f"Trainer '{spec.trainer}' expects {trainer_class.config_class.__name__}, "
+            f"got {type(spec.config).__name__}"
+        )
+    return trainer_class(spec.config)
+
+def trainer_spec_from_dict(data: Dict[str, Any]) -> TrainerSpec:
+    trainer_class = get_trainer_class(data["trainer"])
+    params = dict(data.get("params", {}))
+    
+    known_fields = {f.name for f in fields(trainer_class.config_class)}
+    unknown = set(params) - known_fields
+    if unknown:
+        raise ValueError(f"Unknown parameters for trainer '{data['trainer']}': {sorted(unknown)}")
+    
+    # JSON has no tuples, but the vectorizers expect ngram_range as one
+    if "ngram_range" in params:
+        params["ngram_range"] = tuple(params["ngram_range"])
+    
+    return TrainerSpec(trainer=data["trainer"], config=trainer_class.config_class(**params))
+
+def pipeline_config_from_dict(data: Dict[str, Any]) -> PipelineConfig:
+    known_fields = {f.name for f in fields(PipelineConfig)}
+    unknown = set(data) - known_fields
+    if unknown:
+        raise ValueError(f"Unknown pipeline config keys: {sorted(unknown)}")
+    
+    options = dict(data)
+    if "trainers" in options:
+        options["trainers"] = {name: trainer_spec_from_dict(spec) for name, spec in options["trainers"].items()}
+    if "batching" in options:
+        options["batching"] = BatchingConfig(**options["batching"])
+    
+    return PipelineConfig(**options)
+
+def load_pipeline_config(path: Optional[str] = None) -> PipelineConfig:
+    path = path or os.environ.get("PIPELINE_CONFIG_PATH", DEFAULT_CONFIG_PATH)
+    if not os.path.isfile(path):
+        return PipelineConfig()
+    
+    with open(path, "r", encoding="utf-8") as file:
+        config = pipeline_config_from_dict(json.load(file))
+    print(f"Loaded pipeline config from '{path}'")
+    return config
@@ -0,0 +1,40 @@
+"""
+Stochastic Gradient Descent trainer using TF-IDF features.
+
+Fits a linear SGDClassifier with early stopping on a held-out validation
+fraction. Only probabilistic losses are accepted so predictions keep their
+confidence scores.
+"""
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import SGDClassifier
+
+from ai_core.data.models import ModelResult, TrainingData
+from ai_core.models.base_model_trainer import BaseModelTrainer
+from ai_core.config import SGDConfig
+
+PROBABILISTIC_LOSSES = ("log_loss", "modified_huber")
+
+class SGDTrainer(BaseModelTrainer):
+    config_class = SGDConfig
+
+    def __init__(self, config: SGDConfig):
+        super().__init__(config)
+        if config.loss not in PROBABILISTIC_LOSSES:
+            raise ValueError(f"Unsupported loss '{config.loss}', expected one of {PROBABILISTIC_LOSSES}")
+        self.sgd_config = config
+    
+    def train(self, data: TrainingData) -> ModelResult:
+        model = SGDClassifier(
+            loss=self.sgd_config.loss,
+            alpha=self.sgd_config.alpha,
+            tol=self.sgd_config.tol,
+            max_iter=self.sgd_config.max_iter,
+            early_stopping=self.sgd_config.early_stopping,
+            validation_fraction=self.sgd_config.validation_fraction,
+            n_iter_no_change=self.sgd_config.n_iter_no_change,
+            class_weight=self.sgd_config.class_weight,
+            random_state=self.config.random_state,
+        )
+        
+        return self._fit_and_evaluate(data, TfidfVectorizer, model, "SGD Classifier")
@@ -1,87 +1,166 @@
 """
 Model evaluation utilities and a simple prediction service.
 
-The ModelEvaluator is responsilbe for computing accuracy, printing classification reports,
-and saving confusion matrices. 
+The ModelEvaluator is responsilbe for computing the evaluation metrics once per
+model and for rendering confusion matrices lazily, cached per snapshot version.
 And the Prediction service offers a feature to transform text
-and obtain predictions with confidence and human-readable labels.
+and obtain predictions with confidence and human-readable labels, either for a
+single headline or for a batch scored as one sparse matrix.
 """
 
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-import matplotlib.pyplot as plt
+from sklearn.metrics import accuracy_score, confusion_matrix, precision_recall_fscore_support, roc_auc_score
+from matplotlib.figure import Figure
 import seaborn as sns
+import numpy as np
 import os
+import re
+import tempfile
+from dataclasses import replace
+from typing import List, Optional
 
-from ai_core.data.models import ModelResult, PredictionResult
+from ai_core.data.models import CalibrationBin, EvaluationMetrics, ModelResult, PredictionResult
 from ai_core.config import PathConfig, Constants
 
 class ModelEvaluator:
-    def __init__(self, path_config: PathConfig = PathConfig()):
+    def __init__(self, path_config: PathConfig = PathConfig(), calibration_bins: int = 10):
         self.path_config = path_config
+        self.calibration_bins = calibration_bins
     
     def _print_evaluation_results(self, result: ModelResult):
+        metrics = result.metrics
         print(f"\n{result.model_name} Evaluation Results:")
-        print(f"Accuracy: {result.accuracy:.4f}")
-        print("Detailed Classification Report:")
-        print(
-            classification_report(
-                result.y_test, 
-                result.predictions, 
-                target_names=Constants.CLASS_NAMES
-            )
-        )
+        print(f"Accuracy: {metrics.accuracy:.4f}")
+        print(f"Precision: {metrics.precision:.4f}")
+        print(f"Recall: {metrics.recall:.4f}")
+        print(f"F1 Score: {metrics.f1_score:.4f}")
+        print(f"ROC-AUC: {metrics.roc_auc:.4f}")
+        print(f"Confusion Matrix: {metrics.confusion_matrix}")
+    
+    def _compute_calibration(self, y_true: np.ndarray, probabilities: np.ndarray) -> List[CalibrationBin]:
+        edges = np.linspace(0.0, 1.0, self.calibration_bins + 1)
+        bin_ids = np.clip(np.digitize(probabilities, edges[1:-1]), 0, self.calibration_bins - 1)
+        counts = np.bincount(bin_ids, minlength=self.calibration_bins)
+        predicted_sums = np.bincount(bin_ids, weights=probabilities, minlength=self.calibration_bins)
+        positive_sums = np.bincount(bin_ids, weights=y_true, minlength=self.calibration_bins)
+        
+        bins = []
+        for i in range(self.calibration_bins):
+            count = int(counts[i])
+            bins.append(CalibrationBin(
+                lower=float(edges[i]),
+                upper=float(edges[i + 1]),
+                count=count,
+                mean_predicted=float(predicted_sums[i] / count) if count else 0.0,
+                fraction_positive=float(positive_sums[i] / count) if count else 0.0,
+            ))
+        return bins
     
     def evaluate_model(self, result: ModelResult) -> ModelResult:
-        accuracy = accuracy_score(result.y_test, result.predictions)
-        result.accuracy = accuracy
+        y_true = np.asarray(result.y_test)
+        y_pred = np.asarray(result.predictions)
+        positive_column = list(result.model.classes_).index(Constants.POSITIVE_CLASS)
+        probabilities = result.model.predict_proba(result.X_test)[:, positive_column]
+        
+        precision, recall, f1, _ = precision_recall_fscore_support(
+            y_true, y_pred, pos_label=Constants.POSITIVE_CLASS, average="binary", zero_division=0
+        )
+        cm = confusion_matrix(y_true, y_pred, labels=[Constants.NEGATIVE_CLASS, Constants.POSITIVE_CLASS])
+        
+        metrics = EvaluationMetrics(
+            accuracy=float(accuracy_score(y_true, y_pred)),
+            precision=float(precision),
+            recall=float(recall),
+            f1_score=float(f1),
+            roc_auc=float(roc_auc_score(y_true, probabilities)),
+            confusion_matrix=cm.tolist(),
+            calibration=self._compute_calibration(y_true, probabilities),
+        )
+        result = replace(result, metrics=metrics, accuracy=metrics.accuracy)
         
         self._print_evaluation_results(result)
         return result
     
-    def plot_confusion_matrix(self, result: ModelResult) -> None:
-        cm = confusion_matrix(result.y_test, result.predictions)
+    def confusion_matrix_filename(self, name: str, version: Optional[int] = None) -> str:
+        # Keyed by the pipeline name (two entries may share a trainer and display name) and by snapshot
+        # version, so a retrain never reuses a stale image
+        suffix = f"_v{version}" if version is not None else ""
+        return f"{self.path_config.model_save_path}{self.path_config.confusion_matrix_path}_{name}{suffix}.png"
+    
+    def plot_confusion_matrix(self, name: str, result: ModelResult, version: Optional[int] = None) -> str:
+        """Render the confusion matrix PNG on first request and reuse the cached file afterwards."""
+        if result.metrics is None:
+            raise ValueError(f"{result.model_name} has not been evaluated yet")
         
-        plt.figure(figsize=(8, 6))
+        filename = self.confusion_matrix_filename(name, version)
+        if os.path.isfile(filename):
+            return filename
+        
+        # Figure is used instead of pyplot so rendering holds no global state and is safe off the main thread
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
         sns.heatmap(
-            cm,
+            np.asarray(result.metrics.confusion_matrix),
             annot=True,
             fmt="d",
             cmap="Blues",
             xticklabels=Constants.CLASS_NAMES,
             yticklabels=Constants.CLASS_NAMES,
+            ax=ax,
         )
-        plt.title(f"Confusion Matrix - {result.model_name}")
-        plt.xlabel("Predicted Label")
-        plt.ylabel("True Label")
-        plt.tight_layout()
+        ax.set_title(f"Confusion Matrix - {result.model_name}")
+        ax.set_xlabel("Predicted Label")
+        ax.set_ylabel("True Label")
+        fig.tight_layout()
 
-        if not os.path.isdir(self.path_config.model_save_path):
-           os.mkdir(self.path_config.model_save_path) 
+        os.makedirs(self.path_config.model_save_path, exist_ok=True)
         
-        filename = f"{self.path_config.model_save_path}{self.path_config.confusion_matrix_path}_{result.model_name.lower().replace(' ', '_')}.png"
-        plt.savefig(filename, dpi=300, bbox_inches="tight")
+        # Write to a temporary file first so concurrent readers never see a partial PNG
+        fd, temp_filename = tempfile.mkstemp(suffix=".png", dir=self.path_config.model_save_path)
+        with os.fdopen(fd, "wb") as file:
+            fig.savefig(file, format="png", dpi=300, bbox_inches="tight")
+        os.replace(temp_filename, filename)
         print(f"Confusion matrix saved as '{filename}'")
-        plt.close()
+        return filename
+    
+    def prune_confusion_matrices(self, keep_versions: List[int]) -> None:
+        """Delete versioned confusion matrix images of snapshots that are no longer live."""
+        if not os.path.isdir(self.path_config.model_save_path):
+            return
+        
+        pattern = re.compile(rf"^{re.escape(self.path_config.confusion_matrix_path)}_.+_v(\d+)\.png$")
+        for name in os.listdir(self.path_config.model_save_path):
+            match = pattern.match(name)
+            if match and int(match.group(1)) not in keep_versions:
+                try:
+                    os.remove(os.path.join(self.path_config.model_save_path, name))
+                except FileNotFoundError:
+                    pass
 
 class PredictionService:
     def __init__(self, preprocessor):
         self.preprocessor = preprocessor
     
     def predict_sarcasm(self, model_result: ModelResult, text: str) -> PredictionResult:
-        processed_text = self.preprocessor(text)
-        features = model_result.vectorizer.transform([processed_text])
-        prediction = model_result.model.predict(features)[0]
-        probability = model_result.model.predict_proba(features)[0]
+        return self.predict_batch(model_result, [text])[0]
+    
+    def predict_batch(self, model_result: ModelResult, texts: List[str]) -> List[PredictionResult]:
+        processed_texts = [self.preprocessor(text) for text in texts]
+        features = model_result.vectorizer.transform(processed_texts)
+        probabilities = model_result.model.predict_proba(features)
         
-        confidence = probability[prediction]
-        is_sarcastic = prediction == Constants.POSITIVE_CLASS
+        best_indices = probabilities.argmax(axis=1)
+        predictions = model_result.model.classes_[best_indices]
+        confidences = probabilities[np.arange(len(texts)), best_indices]
         
-        return PredictionResult(
-            text=text,
-            prediction=prediction,
-            confidence=confidence,
-            is_sarcastic=is_sarcastic
-        )
+        return [
+            PredictionResult(
+                text=text,
+                prediction=int(prediction),
+                confidence=float(confidence),
+                is_sarcastic=prediction == Constants.POSITIVE_CLASS
+            )
+            for text, prediction, confidence in zip(texts, predictions, confidences)
+        ]
     
     def print_prediction(self, prediction: PredictionResult):
         print(f"\tHeadline: '{prediction.text}'")
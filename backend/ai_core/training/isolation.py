@@ -0,0 +1,177 @@
+"""
+Resource-bounded training in an isolated child process.
+
+`run_training` trains a single model in a child process and watches it from
+the parent: once the wall-time or memory budget is exceeded the child is
+killed and BudgetExceeded is raised, so the caller can retry with a fallback.
+Because the work happens in another process, an out-of-memory kill only takes
+down that child and never the API process serving predictions.
+
+Children are started with forkserver (or spawn where it is missing), never by
+forking the multi-threaded API process directly. Memory is measured as the
+child's own anonymous RSS above what it held right after startup, so modules
+and data shared with its parent do not count against the budget.
+"""
+
+from contextlib import contextmanager
+from dataclasses import replace
+import multiprocessing
+import signal
+import time
+import tracemalloc
+from typing import Optional, Tuple
+
+from ai_core.data.models import ModelResult, TrainingData
+from ai_core.models.base_model_trainer import BaseModelTrainer
+
+POLL_INTERVAL = 0.1
+
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Imported once by the fork server, so each training child starts with sklearn and nltk already loaded
+# and re-importing main.py or app.py as __main__ costs next to nothing against the time budget
+PRELOAD_MODULES = ["ai_core.models.registry", "ai_core.training.pipeline"]
+
+class BudgetExceeded(Exception):
+    def __init__(self, kind: str, message: str):
+        super().__init__(message)
+        self.kind = kind
+
+@contextmanager
+def measure_peak_memory(enabled: bool = True):
+    peak_memory = {"mb": 0.0}
+    if not enabled:
+        yield peak_memory
+        return
+
+    # Another training may already be tracing, in that case only reset the peak and leave tracing on
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        yield peak_memory
+    finally:
+        peak_memory["mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        if started_here:
+            tracemalloc.stop()
+
+def _anonymous_rss_mb(pid: str = "self") -> Optional[float]:
+    """Private (anonymous) resident memory of a process, None where /proc is not available."""
+    try:
+        with open(f"/proc/{pid}/status", "r") as file:
+            for line in file:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+def _get_context():
+    context = multiprocessing.get_context(START_METHOD)
+    if START_METHOD == "forkserver":
+        context.set_forkserver_preload(PRELOAD_MODULES)
+    return context
+
+def _train(trainer: BaseModelTrainer, data: TrainingData, track_memory: bool) -> ModelResult:
+    with measure_peak_memory(track_memory) as peak_memory:
+        start = time.perf_counter()
+        result = trainer.train(data)
+        # The selection-effect refit is reporting overhead, not part of the model's fit cost
+        training_time = time.perf_counter() - start - result.selection_check_time
+    return replace(result, training_time=training_time, peak_memory_mb=peak_memory["mb"] if track_memory else None)
+
+def _train_worker(conn, trainer: BaseModelTrainer, data: TrainingData, track_memory: bool) -> None:
+    # The parent measures memory relative to this, so startup and unpickled inputs are the only baseline
+    conn.send(("started", _anonymous_rss_mb()))
+    try:
+        result = _train(trainer, data, track_memory)
+        # Fits shorter than one poll interval are never sampled by the parent, so report where training ended
+        conn.send(("ok", (result, _anonymous_rss_mb())))
+    except MemoryError:
+        conn.send(("memory", "MemoryError raised while training"))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+def run_training(
+    trainer: BaseModelTrainer,
+    data: TrainingData,
+    max_seconds: Optional[float] = None,
+    track_memory: bool = False,
+    isolate: bool = True,
+) -> Tuple[ModelResult, Optional[float]]:
+    """
+    Train one model within `max_seconds` and the config's memory budget.
+
+    Returns the result and the peak memory in MB the child allocated above its
+    starting point (None when it could not be measured).
+    """
+    max_memory_mb = trainer.config.max_memory_mb
+
+    if not isolate:
+        # Nothing can stop an in-process fit, so refuse budgets that would silently not apply
+        if max_seconds is not None or max_memory_mb is not None:
+            raise ValueError("Time and memory budgets require isolated training")
+        try:
+            return _train(trainer, data, track_memory), None
+        except MemoryError:
+            raise BudgetExceeded("memory", "MemoryError raised while training")
+
+    context = _get_context()
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(target=_train_worker, args=(child_conn, trainer, data, track_memory), daemon=True)
+    process.start()
+    child_conn.close()
+
+    deadline = time.monotonic() + max_seconds if max_seconds is not None else None
+    baseline = None
+    peak_memory = None
+
+    try:
+        while True:
+            if parent_conn.poll(POLL_INTERVAL):
+                try:
+                    status, payload = parent_conn.recv()
+                except EOFError:
+                    break
+                if status == "started":
+                    baseline = payload
+                    continue
+                process.join()
+                if status == "ok":
+                    result, rss = payload
+                    if rss is not None and baseline is not None:
+                        peak_memory = max(peak_memory or 0.0, rss - baseline, 0.0)
+                    return result, peak_memory
+                if status == "memory":
+                    raise BudgetExceeded("memory", payload)
+                raise RuntimeError(payload)
+
+            if not process.is_alive():
+                break
+
+            if deadline is not None and time.monotonic() > deadline:
+                raise BudgetExceeded(
+                    "time", f"Time budget of {max_seconds:.1f}s exceeded with {len(data.headlines):,} rows"
+                )
+
+            rss = _anonymous_rss_mb(str(process.pid))
+            if rss is not None and baseline is not None:
+                used = max(rss - baseline, 0.0)
+                peak_memory = max(peak_memory or 0.0, used)
+                if max_memory_mb is not None and used > max_memory_mb:
+                    raise BudgetExceeded(
+                        "memory", f"Memory budget of {max_memory_mb:.0f} MB exceeded ({used:.0f} MB allocated)"
+                    )
+    finally:
+        if process.is_alive():
+            process.kill()
+            process.join()
+        parent_conn.close()
+
+    # The child died without sending a result, SIGKILL almost always means the OOM killer
+    if process.exitcode == -getattr(signal, "SIGKILL", 9):
+        raise BudgetExceeded("memory", "Training process was killed (likely out of memory)")
+    raise RuntimeError(f"Training process exited unexpectedly with code {process.exitcode}")
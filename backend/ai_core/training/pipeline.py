@@ -1,30 +1,45 @@
 """
 End-to-end pipeline that prepares data, trains models, evaluates, and predicts.
 
-This class orchestrates preprocessing, training both Logistic Regression and
-Naive Bayes models, evaluating them, generating artifacts, and providing
-helpers to expose comparable results and predictions to the API layer.
+This class orchestrates preprocessing, training every model configured in
+PipelineConfig within its budgets, evaluating them, generating artifacts, and
+providing helpers to expose comparable results and predictions to the API layer.
 """
 
-from ai_core.data.models import ModelResult, TrainingData
-from ai_core.models.logistic_regression_trainer import LogisticRegressionTrainer
-from ai_core.models.bayes_naive_trainer import NaiveBayesTrainer
-from ai_core.config import ModelConfig, LogisticRegressionConfig
+from ai_core.data.models import BudgetOutcome, ModelResult, TrainingData
+from ai_core.models.base_model_trainer import BaseModelTrainer
+from ai_core.models.registry import create_trainer
+from ai_core.config import PipelineConfig
 from ai_core.training.evaluator import ModelEvaluator, PredictionService
+from ai_core.training.isolation import BudgetExceeded, run_training
 from ai_core.utils.preproces import text_preprocessing
-from typing import List, Dict, Any
+from dataclasses import replace
+import time
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
+
+# Below this many rows a subsample is too small to train anything meaningful
+MIN_BUDGET_ROWS = 100
 
 class SarcasmDetectionPipeline:
-    def __init__(self):
-        self.lr_config = LogisticRegressionConfig()
-        self.nb_config = ModelConfig()
+    def __init__(self, config: PipelineConfig = PipelineConfig()):
+        self.config = config
         self.evaluator = ModelEvaluator()
         self.prediction_service = PredictionService(text_preprocessing)
         
-        self.trainers = {
-            "logistic_regression": LogisticRegressionTrainer(self.lr_config),
-            "naive_bayes": NaiveBayesTrainer(self.nb_config)
-        }
+        self.trainers = MappingProxyType({name: create_trainer(spec) for name, spec in config.trainers.items()})
+        
+        if not config.isolate_training:
+            # Budgets can only be enforced on a child process, so fail loudly instead of ignoring them
+            budgeted = [
+                name for name, trainer in self.trainers.items()
+                if trainer.config.max_training_seconds is not None or trainer.config.max_memory_mb is not None
+            ]
+            if budgeted:
+                raise ValueError(
+                    f"isolate_training=False cannot enforce time or memory budgets, set max_training_seconds "
+                    f"and max_memory_mb to null for: {', '.join(budgeted)}"
+                )
 
     def prepare_data(self, raw_data: List[Dict[str, Any]]) -> TrainingData:
         headlines = []
@@ -38,18 +53,104 @@ class SarcasmDetectionPipeline:
         return TrainingData(headlines=headlines, labels=labels)
     
     def train_models(self, data: TrainingData) -> Dict[str, ModelResult]:
+        return self.train_models_with_budgets(data)[0]
+    
+    def train_models_with_budgets(self, data: TrainingData) -> Tuple[Dict[str, ModelResult], Dict[str, BudgetOutcome]]:
         results = {}
+        outcomes = {}
         
         for name, trainer in self.trainers.items():
             print("\n" + "="*50)
             print(f"TRAINING {name.replace('_', ' ').title()}...")
             print("="*50)
-            result = trainer.train(data)
+            result, outcomes[name] = self._train_within_budget(trainer, data)
+            
+            for event in outcomes[name].events:
+                print(f"Budget: {event}")
+            if result is None:
+                print(f"Skipping {name}, it did not finish within its budget")
+                continue
+            
             result = self.evaluator.evaluate_model(result)
-            self.evaluator.plot_confusion_matrix(result)
             results[name] = result
         
-        return results
+        if not results:
+            raise RuntimeError("No model finished training within its budget")
+        
+        return results, outcomes
+    
+    def _train_within_budget(self, trainer: BaseModelTrainer, data: TrainingData) -> Tuple[Optional[ModelResult], BudgetOutcome]:
+        config = trainer.config
+        fallbacks = []
+        events = []
+        peak_rss = None
+        attempt = 0
+        
+        if config.max_rows and len(data.headlines) > config.max_rows:
+            events.append(f"{len(data.headlines):,} rows exceed max_rows={config.max_rows:,}, subsampling")
+            data = data.subsample(config.max_rows, config.random_state)
+            fallbacks.append("subsample")
+        
+        # The time budget covers every attempt together
+        deadline = time.monotonic() + config.max_training_seconds if config.max_training_seconds is not None else None
+        
+        for attempt in range(1, config.max_training_attempts + 1):
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                events.append(f"Time budget of {config.max_training_seconds:.1f}s used up before attempt {attempt}")
+                attempt -= 1
+                break
+            
+            # Hold back time for the fallbacks, a subsample of budget_subsample_fraction of the rows needs
+            # roughly that share of it; the last attempt gets everything that is left
+            attempt_seconds = remaining
+            if remaining is not None and attempt < config.max_training_attempts:
+                attempt_seconds = remaining * (1 - config.budget_subsample_fraction)
+            
+            try:
+                result, peak_rss = run_training(trainer, data, attempt_seconds, self.config.track_memory, self.config.isolate_training)
+                return result, BudgetOutcome(
+                    completed=True,
+                    fallbacks=fallbacks,
+                    rows_used=len(data.headlines),
+                    attempts=attempt,
+                    peak_rss_mb=peak_rss,
+                    events=events
+                )
+            except BudgetExceeded as e:
+                events.append(str(e))
+                exceeded = e.kind
+            
+            if attempt == config.max_training_attempts:
+                break
+            
+            # Memory blowups come from the n-gram vocabulary, so drop it first; anything else gets less data
+            if exceeded == "memory" and config.featurizer != "hashing":
+                events.append("Falling back to the hashing featurizer")
+                config = replace(config, featurizer="hashing")
+                trainer = type(trainer)(config)
+                fallbacks.append("hashing")
+                continue
+            
+            rows = int(len(data.headlines) * config.budget_subsample_fraction)
+            if rows < MIN_BUDGET_ROWS:
+                break
+            events.append(f"Falling back to a subsample of {rows:,} rows")
+            data = data.subsample(rows, config.random_state)
+            if "subsample" not in fallbacks:
+                fallbacks.append("subsample")
+        
+        return None, BudgetOutcome(
+            completed=False,
+            fallbacks=fallbacks,
+            rows_used=len(data.headlines),
+            attempts=attempt,
+            peak_rss_mb=peak_rss,
+            events=events
+        )
+    
+    def save_confusion_matrices(self, model_results: Dict[str, ModelResult]) -> Dict[str, str]:
+        return {name: self.evaluator.plot_confusion_matrix(name, result) for name, result in model_results.items()}
     
     def run_predictions(self, model_results: Dict[str, ModelResult], test_texts: List[str]):
         print("\n" + "="*50)
@@ -69,7 +170,12 @@ class SarcasmDetectionPipeline:
         print("="*50)
         
         for name, result in model_results.items():
-            print(f"{result.model_name}: {result.accuracy:.2%} accuracy")
+            print(f"{result.model_name}: {result.accuracy:.2%} accuracy ({result.training_time:.2f}s, {result.n_features:,} features)")
+            if result.accuracy_without_selection is not None:
+                print(f"\t• Without feature selection: {result.accuracy_without_selection:.2%} accuracy "
+                      f"({result.n_candidate_features:,} features, {result.accuracy - result.accuracy_without_selection:+.2%})")
+            if result.peak_memory_mb is not None:
+                print(f"\t• Peak traced memory: {result.peak_memory_mb:.1f} MB")
         
         best_model = max(model_results.values(), key=lambda x: x.accuracy)
         print(f"\nBest Model: {best_model.model_name} ({best_model.accuracy:.2%})")
@@ -154,35 +260,60 @@ class SarcasmDetectionPipeline:
                 "name": result.model_name,
                 "type": name,
                 "accuracy": float(result.accuracy),
-                "test_set_size": len(result.y_test)
+                "test_set_size": len(result.y_test),
+                "precision": result.metrics.precision,
+                "recall": result.metrics.recall,
+                "f1_score": result.metrics.f1_score,
+                "roc_auc": result.metrics.roc_auc,
+                "confusion_matrix": result.metrics.confusion_matrix,
+                "training_time": float(result.training_time),
+                "n_features": result.n_features,
+                "n_candidate_features": result.n_candidate_features,
+                "accuracy_without_selection": result.accuracy_without_selection,
+                "peak_memory_mb": result.peak_memory_mb
             }
             comparison["models"].append(model_data)
             
             if result.accuracy > comparison["best_accuracy"]:
                 comparison["best_accuracy"] = float(result.accuracy)
-                comparison["best_model"] = result.model_name
+                comparison["best_model"] = name
         
         return comparison
 
-    def get_predictions(self, model_results: Dict[str, ModelResult], headline: str) -> Dict[str, Any]:
-        predictions = {
-            "headline": headline,
-            "predictions": []
-        }
+    def get_budget_outcomes(self, outcomes: Dict[str, BudgetOutcome]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "type": name,
+                "completed": outcome.completed,
+                "fallbacks": outcome.fallbacks,
+                "rows_used": outcome.rows_used,
+                "attempts": outcome.attempts,
+                "peak_rss_mb": float(outcome.peak_rss_mb) if outcome.peak_rss_mb is not None else None,
+                "events": outcome.events
+            }
+            for name, outcome in outcomes.items()
+        ]
+
+    def get_predictions(self, model_results: Mapping[str, ModelResult], headline: str) -> Dict[str, Any]:
+        return self.get_batch_predictions(model_results, [headline])[0]
+
+    def get_batch_predictions(self, model_results: Mapping[str, ModelResult], headlines: List[str]) -> List[Dict[str, Any]]:
+        batch = [{"headline": headline, "predictions": []} for headline in headlines]
         
         for name, result in model_results.items():
-            prediction_result = self.prediction_service.predict_sarcasm(result, headline)
+            prediction_results = self.prediction_service.predict_batch(result, headlines)
             
-            prediction_data = {
-                "model_name": result.model_name,
-                "model_type": name,
-                "prediction": prediction_result.prediction_label,
-                "is_sarcastic": bool(prediction_result.is_sarcastic),
-                "confidence": float(prediction_result.confidence)
-            }
-            predictions["predictions"].append(prediction_data)
+            for predictions, prediction_result in zip(batch, prediction_results):
+                prediction_data = {
+                    "model_name": result.model_name,
+                    "model_type": name,
+                    "prediction": prediction_result.prediction_label,
+                    "is_sarcastic": bool(prediction_result.is_sarcastic),
+                    "confidence": float(prediction_result.confidence)
+                }
+                predictions["predictions"].append(prediction_data)
         
-        return predictions
+        return batch
 
     def get_analysis_data(self, data: TrainingData) -> Dict[str, Any]:
         total_samples = len(data.headlines)
@@ -0,0 +1,48 @@
+"""
+Atomic publication of trained models for serving.
+
+SnapshotStore holds the current ModelSnapshot. Readers take a reference to
+`current` without locking and keep using that snapshot for the whole request,
+even if training publishes a newer one meanwhile. Writers build a complete new
+snapshot and swap the reference in a single assignment, so readers never see
+a half-updated set of models. A replaced snapshot is freed by reference
+counting as soon as the last request holding it finishes.
+"""
+
+import threading
+import time
+import weakref
+from types import MappingProxyType
+from typing import Dict, List, Optional
+
+from ai_core.data.models import ModelResult, ModelSnapshot
+from ai_core.utils.preproces import PREPROCESSING_VERSION
+
+class SnapshotStore:
+    def __init__(self):
+        self._current: Optional[ModelSnapshot] = None
+        self._version = 0
+        self._publish_lock = threading.Lock()
+        self._live: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    @property
+    def current(self) -> Optional[ModelSnapshot]:
+        return self._current
+
+    def publish(self, model_results: Dict[str, ModelResult]) -> ModelSnapshot:
+        # Only writers serialize, the lock just keeps versions unique and ordered
+        with self._publish_lock:
+            self._version += 1
+            snapshot = ModelSnapshot(
+                version=self._version,
+                model_results=MappingProxyType(dict(model_results)),
+                preprocessing_version=PREPROCESSING_VERSION,
+                created_at=time.time(),
+            )
+            self._live[snapshot.version] = snapshot
+            self._current = snapshot
+        return snapshot
+
+    def live_versions(self) -> List[int]:
+        """Versions still referenced by the store or by in-flight requests."""
+        return sorted(self._live.keys())
@@ -0,0 +1,72 @@
+"""
+Vocabulary building with streaming n-gram pruning and supervised feature selection.
+
+N-gram document frequencies are counted with lossy counting: every
+`1 / error_rate` documents the rare n-grams are dropped, so the count table
+stays bounded instead of holding every 1-3-gram of the corpus at once. The
+surviving candidates are then ranked against the labels with chi-square or
+mutual information, and only the top features make it into the vectorizer's
+fixed vocabulary.
+"""
+
+import math
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_selection import SelectKBest, chi2, mutual_info_classif
+
+def count_document_frequencies(texts: Iterable[str], analyzer: Callable[[str], List[str]], error_rate: float) -> Dict[str, int]:
+    bucket_width = max(1, math.ceil(1 / error_rate))
+    counts: Dict[str, List[int]] = {} # term -> [count, maximum undercount]
+    bucket = 1
+
+    for i, text in enumerate(texts, 1):
+        for term in set(analyzer(text)):
+            entry = counts.get(term)
+            if entry is None:
+                counts[term] = [1, bucket - 1]
+            else:
+                entry[0] += 1
+
+        if i % bucket_width == 0:
+            counts = {term: entry for term, entry in counts.items() if entry[0] + entry[1] > bucket}
+            bucket += 1
+
+    return {term: entry[0] for term, entry in counts.items()}
+
+def candidate_vocabulary(
+    doc_frequencies: Dict[str, int],
+    n_documents: int,
+    min_df: int,
+    max_df: float,
+    max_features: int,
+) -> List[str]:
+    max_count = max_df if isinstance(max_df, int) else max_df * n_documents
+    candidates = [term for term, count in doc_frequencies.items() if min_df <= count <= max_count]
+    candidates.sort(key=lambda term: (-doc_frequencies[term], term))
+    return candidates[:max_features]
+
+def select_features(
+    texts: List[str],
+    labels: List[int],
+    vocabulary: List[str],
+    analyzer: Callable[[str], List[str]],
+    method: Optional[str],
+    k: int,
+    random_state: int,
+) -> List[str]:
+    if method is None or k >= len(vocabulary):
+        return vocabulary
+
+    score_functions = {
+        "chi2": chi2,
+        "mutual_info": lambda X, y: mutual_info_classif(X, y, discrete_features=True, random_state=random_state),
+    }
+    if method not in score_functions:
+        raise ValueError(f"Unknown feature selection method '{method}', expected one of {sorted(score_functions)}")
+
+    counter = CountVectorizer(analyzer=analyzer, vocabulary=vocabulary)
+    X = counter.transform(texts)
+
+    selector = SelectKBest(score_functions[method], k=k).fit(X, labels)
+    return [term for term, keep in zip(vocabulary, selector.get_support()) if keep]
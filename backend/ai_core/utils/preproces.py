@@ -3,17 +3,34 @@ Text preprocessing utilities for cleaning and tokenizing headlines.
 
 It provides helper functions to remove URLs and punctuation, strip English stop words, and
 tokenize text. These helpers are used by the pipeline before vectorization and 
-model training/prediction.
+model training/prediction. The NLTK data they need is downloaded on first use,
+and only if it is missing, so importing this module never touches the network.
 """
 
+from functools import cache
 import re
 import string
 import nltk
-nltk.download("stopwords")
-nltk.download("punkt_tab")
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 
+# Bump whenever text_preprocessing changes output, models trained on another version are incompatible
+PREPROCESSING_VERSION = "1"
+
+# NLTK package name -> path nltk.data.find looks it up under
+NLTK_RESOURCES = {
+    "stopwords": "corpora/stopwords",
+    "punkt_tab": "tokenizers/punkt_tab",
+}
+
+@cache
+def _ensure_nltk_data() -> None:
+    for package, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(package)
+
 def text_preprocessing(text: str) -> str:
     text.lower()
     text = _remove_urls(text)
@@ -37,7 +54,7 @@ def _remove_punctuations(text: str) -> str:
     return text.translate(translator)
 
 def _remove_stop_words(text: str) -> str:
-    
+    _ensure_nltk_data()
     words = word_tokenize(text)
     stop_words = set(stopwords.words("english"))
 
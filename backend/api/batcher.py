@@ -0,0 +1,98 @@
+"""
+In-process micro-batching for the `/predict` endpoint.
+
+Single-headline requests are queued and collected for up to `max_wait_ms` or
+until `max_batch_size` headlines are waiting, then scored together so every
+model pays the vectorizer and predict_proba overhead once per batch instead of
+once per request. Each caller awaits its own future and gets back only its
+own result.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ai_core.config import BatchingConfig
+
+ScoreFunction = Callable[[List[str]], List[Dict[str, Any]]]
+
+class PredictionBatcher:
+    def __init__(self, score_fn: ScoreFunction, config: BatchingConfig = BatchingConfig()):
+        self.score_fn = score_fn
+        self.config = config
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: List[Tuple[str, asyncio.Future]] = []
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+        # The batch being collected or scored when the worker was cancelled would otherwise wait forever
+        pending = self._in_flight
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Prediction batcher stopped"))
+        
+        self._in_flight = []
+
+        self._worker = None
+        self._queue = None
+
+    async def submit(self, headline: str) -> Dict[str, Any]:
+        if self._queue is None:
+            raise RuntimeError("Prediction batcher is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((headline, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        # Collected items are tracked as in flight right away, so stop() can fail them at any point
+        batch = self._in_flight = [await self._queue.get()]
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.max_wait_ms / 1000
+
+        while len(batch) < self.config.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            headlines = [headline for headline, _ in batch]
+
+            try:
+                # Scoring is CPU bound, keep it off the event loop so new requests keep queueing
+                results = await asyncio.to_thread(self.score_fn, headlines)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                self._in_flight = []
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+            self._in_flight = []
@@ -1,17 +1,56 @@
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 class ModelComparison(BaseModel):
     name: str
     type: str
     accuracy: float
     test_set_size: int
+    precision: float
+    recall: float
+    f1_score: float
+    roc_auc: float
+    confusion_matrix: List[List[int]]
+    training_time: float
+    n_features: int
+    n_candidate_features: int
+    accuracy_without_selection: Optional[float]
+    peak_memory_mb: Optional[float]
+
+class CalibrationBin(BaseModel):
+    lower: float
+    upper: float
+    count: int
+    mean_predicted: float
+    fraction_positive: float
+
+class ModelMetricsResponse(BaseModel):
+    name: str
+    type: str
+    model_version: int
+    accuracy: float
+    precision: float
+    recall: float
+    f1_score: float
+    roc_auc: float
+    confusion_matrix: List[List[int]]
+    calibration: List[CalibrationBin]
+
+class BudgetOutcome(BaseModel):
+    type: str
+    completed: bool
+    fallbacks: List[str]
+    rows_used: int
+    attempts: int
+    peak_rss_mb: Optional[float]
+    events: List[str]
 
 class TrainingResponse(BaseModel):
     status: str
     message: str
     model_comparison: List[ModelComparison]
     best_model: str
+    budget_outcomes: List[BudgetOutcome]
 
 class PredictionResult(BaseModel):
     model_name: str
@@ -23,6 +62,7 @@ class PredictionResult(BaseModel):
 class PredictionResponse(BaseModel):
     headline: str
     predictions: List[PredictionResult]
+    model_version: int
 
 class BasicStatistics(BaseModel):
     total_samples: int
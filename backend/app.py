@@ -1,10 +1,15 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
+import asyncio
 import json
 
-from api.schemas import TrainingRequest, TrainingResponse, PredictionRequest, PredictionResponse, AnalysisResponse
+from api.schemas import TrainingRequest, TrainingResponse, PredictionRequest, PredictionResponse, AnalysisResponse, ModelMetricsResponse
+from api.batcher import PredictionBatcher
+from ai_core.models.registry import load_pipeline_config
 from ai_core.training.pipeline import SarcasmDetectionPipeline
+from ai_core.training.snapshots import SnapshotStore
 
 app_state = {}
 
@@ -12,7 +17,7 @@ app_state = {}
 async def lifespan(app: FastAPI):
     print("🚀 Starting Sarcasm Detection API...")
     
-    pipeline = SarcasmDetectionPipeline()
+    pipeline = SarcasmDetectionPipeline(load_pipeline_config())
     app_state["pipeline"] = pipeline
     
     data = []
@@ -37,11 +42,26 @@ async def lifespan(app: FastAPI):
         app_state["training_data"] = None
         print("⚠️ No data loaded")
     
-    app_state["model_results"] = None
+    snapshots = SnapshotStore()
+    app_state["snapshots"] = snapshots
+    app_state["train_lock"] = asyncio.Lock()
+    
+    def score_batch(headlines):
+        # One snapshot per batch, so a concurrent /train never mixes model versions within a batch
+        snapshot = snapshots.current
+        batch = pipeline.get_batch_predictions(snapshot.model_results, headlines)
+        for predictions_data in batch:
+            predictions_data["model_version"] = snapshot.version
+        return batch
+    
+    batcher = PredictionBatcher(score_batch, pipeline.config.batching)
+    await batcher.start()
+    app_state["batcher"] = batcher
     
     print("✅ API startup completed!")
     yield
     print("👋 Shutting down API...")
+    await batcher.stop()
 
 app = FastAPI(
     title="Sarcasm Detection API",
@@ -71,58 +91,113 @@ async def root():
         "endpoints": {
             "train": "POST /train - Train models with dataset",
             "predict": "POST /predict - Predict sarcasm in headline", 
-            "analyze": "GET /analyze - Get dataset statistics"
+            "analyze": "GET /analyze - Get dataset statistics",
+            "metrics": "GET /models/{name}/metrics - Get a model's evaluation metrics and calibration bins",
+            "confusion_matrix": "GET /models/{name}/confusion-matrix - Get a model's confusion matrix image"
         },
         "status": {
             "data_loaded": app_state.get("training_data") is not None,
-            "models_trained": app_state.get("model_results") is not None
+            "models_trained": app_state["snapshots"].current is not None
         }
     }
 
 @app.post("/train", response_model=TrainingResponse)
 async def train_models():
-    try:
-        pipeline = app_state["pipeline"]
-        training_data = app_state["training_data"]
-        
-        if training_data is None:
-            raise HTTPException(status_code=400, detail="No training data available")
-        
-        model_results = pipeline.train_models(training_data)
-        app_state["model_results"] = model_results
-        
-        comparison = pipeline.get_training_comparison(model_results)
-        
-        return TrainingResponse(
-            status="success",
-            message="Models trained successfully",
-            model_comparison=comparison["models"],
-            best_model=comparison["best_model"]
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Training failed: {str(e)}")
+    # Runs are not queued: a second run would only be replaced by (or replace) the first one's snapshot
+    train_lock = app_state["train_lock"]
+    if train_lock.locked():
+        raise HTTPException(status_code=409, detail="Training is already in progress")
+    
+    async with train_lock:
+        try:
+            pipeline = app_state["pipeline"]
+            training_data = app_state["training_data"]
+            
+            if training_data is None:
+                raise HTTPException(status_code=400, detail="No training data available")
+            
+            # Training runs on a worker thread (and each model in a child process) so /predict keeps serving meanwhile
+            model_results, budget_outcomes = await asyncio.to_thread(pipeline.train_models_with_budgets, training_data)
+            snapshots = app_state["snapshots"]
+            snapshot = snapshots.publish(model_results)
+            pipeline.evaluator.prune_confusion_matrices(snapshots.live_versions())
+            
+            comparison = pipeline.get_training_comparison(snapshot.model_results)
+            
+            return TrainingResponse(
+                status="success",
+                message="Models trained successfully" if all(outcome.completed for outcome in budget_outcomes.values())
+                    else "Some models did not finish within their training budgets",
+                model_comparison=comparison["models"],
+                best_model=comparison["best_model"],
+                budget_outcomes=pipeline.get_budget_outcomes(budget_outcomes)
+            )
+            
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Training failed: {str(e)}")
 
 @app.post("/predict", response_model=PredictionResponse)
 async def predict_headline(request: PredictionRequest):
-    """Predict sarcasm using both models"""
+    """Predict sarcasm using all trained models"""
     try:
-        pipeline = app_state["pipeline"]
-        model_results = app_state.get("model_results")
+        batcher = app_state["batcher"]
         
-        if model_results is None:
+        if app_state["snapshots"].current is None:
             raise HTTPException(status_code=400, detail="No models trained yet. Please train models first.")
         
-        predictions_data = pipeline.get_predictions(model_results, request.headline)
+        predictions_data = await batcher.submit(request.headline)
         
         return PredictionResponse(
             headline=predictions_data["headline"],
-            predictions=predictions_data["predictions"]
+            predictions=predictions_data["predictions"],
+            model_version=predictions_data["model_version"]
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
 
+@app.get("/models/{name}/metrics", response_model=ModelMetricsResponse)
+async def get_model_metrics(name: str):
+    """Get the evaluation metrics, confusion matrix and calibration bins of a trained model"""
+    snapshot = app_state["snapshots"].current
+    
+    if snapshot is None:
+        raise HTTPException(status_code=400, detail="No models trained yet. Please train models first.")
+    
+    if name not in snapshot.model_results:
+        raise HTTPException(status_code=404, detail=f"Unknown model '{name}'")
+    
+    result = snapshot.model_results[name]
+    return ModelMetricsResponse(
+        name=result.model_name,
+        type=name,
+        model_version=snapshot.version,
+        **result.metrics.to_dict()
+    )
+
+@app.get("/models/{name}/confusion-matrix")
+async def get_confusion_matrix(name: str):
+    """Render (or reuse the cached) confusion matrix image of a trained model"""
+    snapshot = app_state["snapshots"].current
+    
+    if snapshot is None:
+        raise HTTPException(status_code=400, detail="No models trained yet. Please train models first.")
+    
+    if name not in snapshot.model_results:
+        raise HTTPException(status_code=404, detail=f"Unknown model '{name}'")
+    
+    try:
+        pipeline = app_state["pipeline"]
+        pipeline.evaluator.prune_confusion_matrices(app_state["snapshots"].live_versions())
+        filename = await asyncio.to_thread(
+            pipeline.evaluator.plot_confusion_matrix, name, snapshot.model_results[name], snapshot.version
+        )
+        
+        return FileResponse(filename, media_type="image/png")
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Rendering confusion matrix failed: {str(e)}")
+
 @app.get("/analyze", response_model=AnalysisResponse)
 async def analyze_dataset():
     """Get dataset statistics"""
@@ -145,9 +220,12 @@ async def analyze_dataset():
 @app.get("/status")
 async def get_status():
     """Get current API status"""
+    snapshot = app_state["snapshots"].current
     return {
         "data_loaded": app_state.get("training_data") is not None,
-        "models_trained": app_state.get("model_results") is not None,
+        "models_trained": snapshot is not None,
+        "model_version": snapshot.version if snapshot else None,
+        "live_model_versions": app_state["snapshots"].live_versions(),
         "data_samples": len(app_state["training_data"].headlines) if app_state.get("training_data") else 0
     }
 
@@ -0,0 +1,72 @@
+"""
+Command-line entry point for the load test, run from `backend/`:
+
+    python -m loadtest --duration 10 --concurrency 1 8 32 --mix predict=0.95,analyze=0.04,train=0.01
+    python -m loadtest --save-baseline loadtest_baseline.json
+    python -m loadtest --baseline loadtest_baseline.json --tolerance 0.2
+
+With `--baseline` the process exits with status 1 when any endpoint regressed,
+and with status 2 when the run's settings differ from the baseline's.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Dict
+
+from loadtest.runner import LoadTestConfig, compare_to_baseline, load_report, print_report, run_load_test, save_report
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the Sarcasm Detection API in-process")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run each concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Concurrency levels to run")
+    parser.add_argument("--mix", type=parse_mix, default=None, help="Request weights, e.g. predict=0.95,analyze=0.05")
+    parser.add_argument("--samples", type=int, default=2000, help="Size of the synthetic dataset")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the full report as JSON")
+    parser.add_argument("--save-baseline", help="Store this run as the baseline JSON")
+    parser.add_argument("--baseline", help="Compare this run against a stored baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative RPS/p99 degradation")
+    args = parser.parse_args()
+    
+    config = LoadTestConfig(
+        duration=args.duration,
+        concurrency_levels=tuple(args.concurrency),
+        samples=args.samples,
+        seed=args.seed,
+        **({"request_mix": args.mix} if args.mix else {}),
+    )
+    
+    report = asyncio.run(run_load_test(config))
+    print_report(report)
+    
+    if args.output:
+        save_report(report, args.output)
+    if args.save_baseline:
+        save_report(report, args.save_baseline)
+        print(f"\nBaseline saved as '{args.save_baseline}'")
+    
+    if args.baseline:
+        try:
+            regressions = compare_to_baseline(report, load_report(args.baseline), args.tolerance)
+        except ValueError as e:
+            print(f"\nError: {e}")
+            return 2
+        if regressions:
+            print("\nREGRESSIONS:")
+            for regression in regressions:
+                print(f"\t• {regression}")
+            return 1
+        print("\nNo regressions against baseline.")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
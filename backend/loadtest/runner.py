@@ -0,0 +1,200 @@
+"""
+In-process load driver for the Sarcasm Detection API.
+
+Runs the FastAPI app (including its lifespan) inside the current event loop,
+swaps the loaded dataset for a synthetic one, and drives a weighted mix of
+`/predict`, `/train` and `/analyze` requests through httpx's ASGI transport at
+one or more concurrency levels. Each endpoint is reported with RPS, latency
+percentiles, a latency histogram and its error rate. Reports can be stored as
+a baseline and later runs compared against it to catch regressions.
+"""
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import numpy as np
+
+from loadtest.synthetic import generate_dataset, generate_headline
+
+ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    "predict": ("POST", "/predict"),
+    "train": ("POST", "/train"),
+    "analyze": ("GET", "/analyze"),
+}
+
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+# Absolute error-rate increase tolerated before a run counts as a regression
+ERROR_RATE_SLACK = 0.01
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    duration: float = 10.0
+    concurrency_levels: Tuple[int, ...] = (1, 8, 32)
+    request_mix: Dict[str, float] = field(default_factory=lambda: {"predict": 0.95, "analyze": 0.04, "train": 0.01})
+    samples: int = 2000
+    seed: int = 42
+
+@dataclass
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        self.latencies_ms.append(latency_ms)
+        if not ok:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        total = len(self.latencies_ms)
+        latencies = np.asarray(self.latencies_ms) if total else np.zeros(1)
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        
+        counts = np.histogram(latencies, bins=[0, *HISTOGRAM_BUCKETS_MS, np.inf])[0] if total else []
+        labels = [f"<={bucket}ms" for bucket in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        
+        return {
+            "requests": total,
+            "errors": self.errors,
+            "error_rate": self.errors / total if total else 0.0,
+            "rps": total / elapsed if elapsed else 0.0,
+            "latency_ms": {
+                "mean": float(latencies.mean()),
+                "p50": float(p50),
+                "p90": float(p90),
+                "p99": float(p99),
+                "max": float(latencies.max()),
+            },
+            "histogram": {label: int(count) for label, count in zip(labels, counts)},
+        }
+
+def _build_request(endpoint: str, rng: random.Random) -> Dict[str, Any]:
+    if endpoint == "predict":
+        return {"json": {"headline": generate_headline(rng, rng.random() < 0.5)}}
+    return {}
+
+async def _run_level(client: httpx.AsyncClient, config: LoadTestConfig, concurrency: int) -> Dict[str, Any]:
+    names = list(config.request_mix)
+    weights = [config.request_mix[name] for name in names]
+    stats = {name: EndpointStats() for name in names}
+    
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + config.duration
+    
+    async def worker(worker_id: int) -> None:
+        rng = random.Random(config.seed * 1000 + worker_id)
+        while loop.time() < deadline:
+            endpoint = rng.choices(names, weights)[0]
+            method, path = ENDPOINTS[endpoint]
+            
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, **_build_request(endpoint, rng))
+                # A 409 only means another /train run is still in progress, the API is behaving as designed
+                ok = response.status_code < 400 or (endpoint == "train" and response.status_code == 409)
+            except Exception:
+                ok = False
+            stats[endpoint].record((time.perf_counter() - start) * 1000, ok)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    
+    return {name: endpoint_stats.summary(elapsed) for name, endpoint_stats in stats.items()}
+
+async def run_load_test(config: LoadTestConfig) -> Dict[str, Any]:
+    unknown = set(config.request_mix) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(f"Unknown endpoints in request mix: {sorted(unknown)}, expected {sorted(ENDPOINTS)}")
+    
+    # Imported here so the app (sklearn, matplotlib, nltk) only loads when a test actually runs
+    from app import app, app_state
+    
+    async with app.router.lifespan_context(app):
+        pipeline = app_state["pipeline"]
+        app_state["training_data"] = pipeline.prepare_data(generate_dataset(config.samples, config.seed))
+        
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+            # /predict needs trained models, so train once before measuring
+            response = await client.post("/train")
+            response.raise_for_status()
+            
+            levels = {}
+            for concurrency in config.concurrency_levels:
+                print(f"Running {config.duration:.0f}s at concurrency {concurrency}...")
+                levels[str(concurrency)] = await _run_level(client, config, concurrency)
+    
+    return {
+        "config": {
+            "duration": config.duration,
+            "concurrency_levels": list(config.concurrency_levels),
+            "request_mix": config.request_mix,
+            "samples": config.samples,
+            "seed": config.seed,
+        },
+        "levels": levels,
+    }
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[str]:
+    """Return a description of every endpoint that got slower or less reliable than the baseline."""
+    if report["config"] != baseline["config"]:
+        differences = sorted(key for key in report["config"].keys() | baseline["config"].keys()
+                             if report["config"].get(key) != baseline["config"].get(key))
+        raise ValueError(f"Run config differs from the baseline in {differences}, results are not comparable")
+    
+    regressions = []
+    
+    for level, endpoints in baseline["levels"].items():
+        current_level = report["levels"].get(level)
+        if current_level is None:
+            continue
+        
+        for endpoint, base in endpoints.items():
+            current = current_level.get(endpoint)
+            if current is None or not base["requests"] or not current["requests"]:
+                continue
+            
+            prefix = f"[concurrency {level}] {endpoint}"
+            if current["rps"] < base["rps"] * (1 - tolerance):
+                regressions.append(f"{prefix}: RPS {current['rps']:.1f} < baseline {base['rps']:.1f}")
+            if current["latency_ms"]["p99"] > base["latency_ms"]["p99"] * (1 + tolerance):
+                regressions.append(
+                    f"{prefix}: p99 {current['latency_ms']['p99']:.1f}ms > baseline {base['latency_ms']['p99']:.1f}ms"
+                )
+            if current["error_rate"] > base["error_rate"] + ERROR_RATE_SLACK:
+                regressions.append(
+                    f"{prefix}: error rate {current['error_rate']:.2%} > baseline {base['error_rate']:.2%}"
+                )
+    
+    return regressions
+
+def print_report(report: Dict[str, Any]) -> None:
+    for level, endpoints in report["levels"].items():
+        print("\n" + "="*50)
+        print(f"CONCURRENCY {level}")
+        print("="*50)
+        
+        for endpoint, summary in endpoints.items():
+            latency = summary["latency_ms"]
+            print(f"\n{endpoint}:")
+            print(f"\t• Requests: {summary['requests']:,} ({summary['rps']:.1f} RPS)")
+            print(f"\t• Errors: {summary['errors']:,} ({summary['error_rate']:.2%})")
+            print(f"\t• Latency: p50 {latency['p50']:.1f}ms, p90 {latency['p90']:.1f}ms, p99 {latency['p99']:.1f}ms, max {latency['max']:.1f}ms")
+            print("\t• Histogram:")
+            for bucket, count in summary["histogram"].items():
+                if count:
+                    print(f"\t\t- {bucket:<10} {count:,}")
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
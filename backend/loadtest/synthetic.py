@@ -0,0 +1,54 @@
+"""
+Synthetic headline dataset for load testing.
+
+Generates sarcastic and non-sarcastic headlines from small templates and
+vocabularies, so the API can be exercised without `dataset.json`. The data is
+seeded and therefore identical across runs, which keeps results comparable to
+a stored baseline.
+"""
+
+import random
+from typing import Any, Dict, List
+
+SUBJECTS = [
+    "local man", "area woman", "city council", "tech company", "scientists",
+    "government", "school board", "startup founder", "senator", "family",
+]
+
+SARCASTIC_TEMPLATES = [
+    "{subject} thrilled to spend entire weekend {chore}",
+    "{subject} bravely admits {claim} after years of denial",
+    "nation relieved as {subject} finally solves {problem} with {gadget}",
+    "{subject} heroically survives {chore} for third straight day",
+    "report: {subject} still waiting for {gadget} to fix {problem}",
+]
+
+NEUTRAL_TEMPLATES = [
+    "{subject} announces new plan to address {problem}",
+    "{subject} reports progress on {problem} in annual review",
+    "officials say {subject} will invest in {gadget} next year",
+    "{subject} meets with experts to discuss {problem}",
+    "study finds {subject} spending more time on {chore}",
+]
+
+FILLERS = {
+    "chore": ["answering emails", "doing laundry", "filing taxes", "commuting", "attending meetings"],
+    "claim": ["never reading terms of service", "liking mondays", "owning too many chargers"],
+    "problem": ["housing costs", "traffic congestion", "climate change", "rising inflation", "water shortages"],
+    "gadget": ["blockchain", "a new app", "artificial intelligence", "smart fridge", "another committee"],
+}
+
+def generate_headline(rng: random.Random, sarcastic: bool) -> str:
+    template = rng.choice(SARCASTIC_TEMPLATES if sarcastic else NEUTRAL_TEMPLATES)
+    values = {key: rng.choice(options) for key, options in FILLERS.items()}
+    return template.format(subject=rng.choice(SUBJECTS), **values)
+
+def generate_dataset(samples: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Build raw items in the same shape as `dataset.json` lines."""
+    rng = random.Random(seed)
+    data = []
+    for i in range(samples):
+        sarcastic = i % 2 == 0
+        data.append({"headline": generate_headline(rng, sarcastic), "is_sarcastic": int(sarcastic)})
+    rng.shuffle(data)
+    return data
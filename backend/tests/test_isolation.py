@@ -0,0 +1,103 @@
+import os
+import time
+
+import pytest
+
+from ai_core.config import ModelConfig, PipelineConfig
+from ai_core.data.models import ModelResult, TrainingData
+from ai_core.models.base_model_trainer import BaseModelTrainer
+from ai_core.training.isolation import run_training
+from ai_core.training.pipeline import SarcasmDetectionPipeline
+
+# 1000 rows take 4s, so a 500 row subsample fits in what a 6s budget leaves after the first attempt
+SECONDS_PER_ROW = 0.004
+
+# Trainers are pickled into the training child, so they have to live at module level
+class QuickTrainer(BaseModelTrainer):
+    def train(self, data: TrainingData) -> ModelResult:
+        return _dummy_result(data)
+
+class SleepyTrainer(BaseModelTrainer):
+    def train(self, data: TrainingData) -> ModelResult:
+        time.sleep(len(data.headlines) * SECONDS_PER_ROW)
+        return _dummy_result(data)
+
+class MemoryHogTrainer(BaseModelTrainer):
+    def train(self, data: TrainingData) -> ModelResult:
+        if self.config.featurizer == "vocabulary":
+            ballast = b"x" * (300 * 1024 * 1024)
+            time.sleep(5)
+            del ballast
+        return _dummy_result(data)
+
+def _dummy_result(data: TrainingData) -> ModelResult:
+    return ModelResult(
+        model=None,
+        vectorizer=None,
+        X_test=data.headlines[:10],
+        y_test=data.labels[:10],
+        predictions=data.labels[:10],
+        accuracy=1.0,
+        model_name="Dummy",
+    )
+
+def _dummy_data() -> TrainingData:
+    return TrainingData(headlines=[f"headline {i}" for i in range(1000)], labels=[i % 2 for i in range(1000)])
+
+@pytest.fixture
+def data() -> TrainingData:
+    return _dummy_data()
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_fork_server():
+    # Starting the fork server preloads sklearn, keep that one-off cost out of the budgets under test
+    run_training(QuickTrainer(ModelConfig(max_training_seconds=None, max_memory_mb=None)), _dummy_data())
+
+@pytest.fixture
+def pipeline() -> SarcasmDetectionPipeline:
+    return SarcasmDetectionPipeline(PipelineConfig(trainers={}))
+
+def test_time_budget_falls_back_to_subsample(pipeline, data):
+    trainer = SleepyTrainer(ModelConfig(max_training_seconds=6.0, max_memory_mb=None, max_training_attempts=2))
+
+    result, outcome = pipeline._train_within_budget(trainer, data)
+
+    assert result is not None
+    assert outcome.completed
+    assert outcome.attempts == 2
+    assert outcome.fallbacks == ["subsample"]
+    assert outcome.rows_used == 500
+    # The first attempt only gets the share of the budget not held back for the fallback
+    assert outcome.events[0].startswith("Time budget of 3.0s exceeded with 1,000 rows")
+
+def test_no_fallback_after_last_attempt(pipeline, data):
+    trainer = SleepyTrainer(ModelConfig(max_training_seconds=1.0, max_memory_mb=None, max_training_attempts=1))
+
+    result, outcome = pipeline._train_within_budget(trainer, data)
+
+    assert result is None
+    assert not outcome.completed
+    assert outcome.attempts == 1
+    assert outcome.fallbacks == []
+    assert outcome.rows_used == 1000
+    assert outcome.events == ["Time budget of 1.0s exceeded with 1,000 rows"]
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="memory is measured through /proc")
+def test_memory_budget_falls_back_to_hashing(pipeline, data):
+    trainer = MemoryHogTrainer(ModelConfig(max_training_seconds=None, max_memory_mb=100))
+
+    result, outcome = pipeline._train_within_budget(trainer, data)
+
+    assert result is not None
+    assert outcome.completed
+    assert outcome.fallbacks == ["hashing"]
+    assert outcome.attempts == 2
+    assert outcome.events[0].startswith("Memory budget of 100 MB exceeded")
+
+def test_rejects_zero_attempts():
+    with pytest.raises(ValueError, match="max_training_attempts"):
+        SleepyTrainer(ModelConfig(max_training_attempts=0))
+
+def test_rejects_budgets_without_isolation():
+    with pytest.raises(ValueError, match="isolate_training=False"):
+        SarcasmDetectionPipeline(PipelineConfig(isolate_training=False))